@@ -37,6 +37,11 @@ class OpenCVCameraConfig(CameraConfig):
     OpenCVCameraConfig(0, 90, 640, 480)
     OpenCVCameraConfig(0, 30, 1280, 720)
     ```
+
+    `buffer_size` sets the number of frames queued by the capture backend (`cv2.CAP_PROP_BUFFERSIZE`).
+    Setting it to 1 makes `camera.read()` return the most recent frame instead of a stale one queued by the
+    driver, at the cost of dropping frames when they are not read fast enough. It is only supported by
+    some backends (e.g. V4L2 on Linux) and is ignored by the others.
     """
 
     camera_index: int
@@ -46,6 +51,7 @@ class OpenCVCameraConfig(CameraConfig):
     color_mode: str = "rgb"
     channels: int | None = None
     rotation: int | None = None
+    buffer_size: int | None = None
     mock: bool = False
 
     def __post_init__(self):
@@ -59,6 +65,9 @@ class OpenCVCameraConfig(CameraConfig):
         if self.rotation not in [-90, None, 90, 180]:
             raise ValueError(f"`rotation` must be in [-90, None, 90, 180] (got {self.rotation})")
 
+        if self.buffer_size is not None and self.buffer_size < 1:
+            raise ValueError(f"`buffer_size` must be at least 1 (got {self.buffer_size})")
+
 
 @CameraConfig.register_subclass("intelrealsense")
 @dataclass
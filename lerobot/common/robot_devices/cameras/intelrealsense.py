@@ -41,6 +41,10 @@ from lerobot.common.utils.utils import capture_timestamp_utc
 
 SERIAL_NUMBER_INDEX = 1
 
+# Number of seconds between two checks that the thread of `async_read` is still alive while it waits for the
+# first frame. Unlike `opencv.ASYNC_READ_TIMEOUT_S`, waiting does not time out as long as the thread is alive.
+ASYNC_READ_THREAD_CHECK_PERIOD_S = 1
+
 
 def find_cameras(raise_when_empty=True, mock=False) -> list[dict]:
     """
@@ -248,8 +252,10 @@ class IntelRealSenseCamera:
         self.is_connected = False
         self.thread = None
         self.stop_event = None
-        self.color_image = None
-        self.depth_map = None
+        self.first_frame_event = None
+        # Latest output of `read()`, published by the `async_read` thread as a single object so that
+        # the color image and depth map of a given frame are always returned together.
+        self.latest_frame = None
         self.logs = {}
 
         if self.mock:
@@ -396,18 +402,24 @@ class IntelRealSenseCamera:
                 f"Expected color values are 'rgb' or 'bgr', but {requested_color_mode} is provided."
             )
 
-        # IntelRealSense uses RGB format as default (red, green, blue).
-        if requested_color_mode == "bgr":
-            color_image = cv2.cvtColor(color_image, cv2.COLOR_RGB2BGR)
-
         h, w, _ = color_image.shape
         if h != self.capture_height or w != self.capture_width:
             raise OSError(
                 f"Can't capture color image with expected height and width ({self.height} x {self.width}). ({h} x {w}) returned instead."
             )
 
-        if self.rotation is not None:
-            color_image = cv2.rotate(color_image, self.rotation)
+        # IntelRealSense uses RGB format as default (red, green, blue).
+        if requested_color_mode == "bgr" and self.rotation == cv2.ROTATE_180:
+            # A 180 degree rotation reverses the order of the pixels, and the RGB to BGR conversion reverses
+            # the order of the channels inside each pixel. Flipping the image along both axes once it is seen
+            # as a (height, width * channels) array does both in a single pass over the memory.
+            color_image = cv2.flip(color_image.reshape(h, -1), -1).reshape(h, w, -1)
+        else:
+            if requested_color_mode == "bgr":
+                color_image = cv2.cvtColor(color_image, cv2.COLOR_RGB2BGR)
+
+            if self.rotation is not None:
+                color_image = cv2.rotate(color_image, self.rotation)
 
         # log the number of seconds it took to read the image
         self.logs["delta_timestamp_s"] = time.perf_counter() - start_time
@@ -437,10 +449,8 @@ class IntelRealSenseCamera:
 
     def read_loop(self):
         while not self.stop_event.is_set():
-            if self.use_depth:
-                self.color_image, self.depth_map = self.read()
-            else:
-                self.color_image = self.read()
+            self.latest_frame = self.read()
+            self.first_frame_event.set()
 
     def async_read(self):
         """Access the latest color image"""
@@ -451,24 +461,20 @@ class IntelRealSenseCamera:
 
         if self.thread is None:
             self.stop_event = threading.Event()
+            self.first_frame_event = threading.Event()
             self.thread = Thread(target=self.read_loop, args=())
             self.thread.daemon = True
             self.thread.start()
 
-        num_tries = 0
-        while self.color_image is None:
+        # Wake up as soon as the thread has captured its first frame, instead of polling every frame period.
+        while not self.first_frame_event.wait(timeout=ASYNC_READ_THREAD_CHECK_PERIOD_S):
             # TODO(rcadene, aliberts): intelrealsense has diverged compared to opencv over here
-            num_tries += 1
-            time.sleep(1 / self.fps)
-            if num_tries > self.fps and (self.thread.ident is None or not self.thread.is_alive()):
+            if self.thread.ident is None or not self.thread.is_alive():
                 raise Exception(
                     "The thread responsible for `self.async_read()` took too much time to start. There might be an issue. Verify that `self.thread.start()` has been called."
                 )
 
-        if self.use_depth:
-            return self.color_image, self.depth_map
-        else:
-            return self.color_image
+        return self.latest_frame
 
     def disconnect(self):
         if not self.is_connected:
@@ -482,6 +488,7 @@ class IntelRealSenseCamera:
             self.thread.join()
             self.thread = None
             self.stop_event = None
+            self.first_frame_event = None
 
         self.camera.stop()
         self.camera = None
@@ -44,6 +44,12 @@ from lerobot.common.utils.utils import capture_timestamp_utc
 # treat the same cameras as new devices. Thus we select a higher bound to search indices.
 MAX_OPENCV_INDEX = 60
 
+# Maximum number of seconds `async_read` waits for the first frame captured by its thread.
+ASYNC_READ_TIMEOUT_S = 2
+
+# Number of seconds the thread of `async_read` waits before retrying after a failed read.
+READ_ERROR_RETRY_PERIOD_S = 0.1
+
 
 def find_cameras(raise_when_empty=False, max_index_search_range=MAX_OPENCV_INDEX, mock=False) -> list[dict]:
     cameras = []
@@ -259,12 +265,14 @@ class OpenCVCamera:
         self.fps = config.fps
         self.channels = config.channels
         self.color_mode = config.color_mode
+        self.buffer_size = config.buffer_size
         self.mock = config.mock
 
         self.camera = None
         self.is_connected = False
         self.thread = None
         self.stop_event = None
+        self.first_frame_event = None
         self.color_image = None
         self.logs = {}
 
@@ -338,6 +346,9 @@ class OpenCVCamera:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.capture_width)
         if self.capture_height is not None:
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.capture_height)
+        if self.buffer_size is not None:
+            # Not all backends support it, in which case the frames keep being queued by the driver.
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
 
         actual_fps = self.camera.get(cv2.CAP_PROP_FPS)
         actual_width = self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)
@@ -379,6 +390,11 @@ class OpenCVCamera:
                 f"OpenCVCamera({self.camera_index}) is not connected. Try running `camera.connect()` first."
             )
 
+        if self.mock:
+            import tests.cameras.mock_cv2 as cv2
+        else:
+            import cv2
+
         start_time = time.perf_counter()
 
         ret, color_image = self.camera.read()
@@ -393,25 +409,26 @@ class OpenCVCamera:
                 f"Expected color values are 'rgb' or 'bgr', but {requested_color_mode} is provided."
             )
 
-        # OpenCV uses BGR format as default (blue, green, red) for all operations, including displaying images.
-        # However, Deep Learning framework such as LeRobot uses RGB format as default to train neural networks,
-        # so we convert the image color from BGR to RGB.
-        if requested_color_mode == "rgb":
-            if self.mock:
-                import tests.cameras.mock_cv2 as cv2
-            else:
-                import cv2
-
-            color_image = cv2.cvtColor(color_image, cv2.COLOR_BGR2RGB)
-
         h, w, _ = color_image.shape
         if h != self.capture_height or w != self.capture_width:
             raise OSError(
                 f"Can't capture color image with expected height and width ({self.height} x {self.width}). ({h} x {w}) returned instead."
             )
 
-        if self.rotation is not None:
-            color_image = cv2.rotate(color_image, self.rotation)
+        # OpenCV uses BGR format as default (blue, green, red) for all operations, including displaying images.
+        # However, Deep Learning framework such as LeRobot uses RGB format as default to train neural networks,
+        # so we convert the image color from BGR to RGB.
+        if requested_color_mode == "rgb" and self.rotation == cv2.ROTATE_180:
+            # A 180 degree rotation reverses the order of the pixels, and the BGR to RGB conversion reverses
+            # the order of the channels inside each pixel. Flipping the image along both axes once it is seen
+            # as a (height, width * channels) array does both in a single pass over the memory.
+            color_image = cv2.flip(color_image.reshape(h, -1), -1).reshape(h, w, -1)
+        else:
+            if requested_color_mode == "rgb":
+                color_image = cv2.cvtColor(color_image, cv2.COLOR_BGR2RGB)
+
+            if self.rotation is not None:
+                color_image = cv2.rotate(color_image, self.rotation)
 
         # log the number of seconds it took to read the image
         self.logs["delta_timestamp_s"] = time.perf_counter() - start_time
@@ -427,8 +444,12 @@ class OpenCVCamera:
         while not self.stop_event.is_set():
             try:
                 self.color_image = self.read()
+                self.first_frame_event.set()
             except Exception as e:
                 print(f"Error reading in thread: {e}")
+                # A failing read returns immediately (e.g. unplugged camera), so wait a bit before retrying
+                # instead of spinning a CPU core. A fixed period is used since some backends report an fps of 0.
+                self.stop_event.wait(READ_ERROR_RETRY_PERIOD_S)
 
     def async_read(self):
         if not self.is_connected:
@@ -438,19 +459,16 @@ class OpenCVCamera:
 
         if self.thread is None:
             self.stop_event = threading.Event()
+            self.first_frame_event = threading.Event()
             self.thread = Thread(target=self.read_loop, args=())
             self.thread.daemon = True
             self.thread.start()
 
-        num_tries = 0
-        while True:
-            if self.color_image is not None:
-                return self.color_image
+        # Wake up as soon as the thread has captured its first frame, instead of polling every frame period.
+        if not self.first_frame_event.wait(timeout=ASYNC_READ_TIMEOUT_S):
+            raise TimeoutError("Timed out waiting for async_read() to start.")
 
-            time.sleep(1 / self.fps)
-            num_tries += 1
-            if num_tries > self.fps * 2:
-                raise TimeoutError("Timed out waiting for async_read() to start.")
+        return self.color_image
 
     def disconnect(self):
         if not self.is_connected:
@@ -463,6 +481,7 @@ class OpenCVCamera:
             self.thread.join()  # wait for the thread to finish
             self.thread = None
             self.stop_event = None
+            self.first_frame_event = None
 
         self.camera.release()
         self.camera = None
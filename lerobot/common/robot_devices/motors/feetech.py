@@ -17,7 +17,6 @@ import logging
 import math
 import time
 import traceback
-from copy import deepcopy
 
 import numpy as np
 import tqdm
@@ -197,8 +196,7 @@ def get_queue_name(fn_name, data_name, motor_names):
     return queue_name
 
 
-def get_log_name(var_name, fn_name, data_name, motor_names):
-    group_key = get_group_sync_key(data_name, motor_names)
+def get_log_name(var_name, fn_name, group_key):
     log_name = f"{var_name}_{fn_name}_{group_key}"
     return log_name
 
@@ -293,12 +291,14 @@ class FeetechMotorsBus:
         self.motors = config.motors
         self.mock = config.mock
 
-        self.model_ctrl_table = deepcopy(MODEL_CONTROL_TABLE)
-        self.model_resolution = deepcopy(MODEL_RESOLUTION)
+        # These tables are only read, so all buses share them instead of holding a copy
+        self.model_ctrl_table = MODEL_CONTROL_TABLE
+        self.model_resolution = MODEL_RESOLUTION
 
         self.port_handler = None
         self.packet_handler = None
         self.calibration = None
+        self.calibration_indices = None
         self.is_connected = False
         self.group_readers = {}
         self.group_writers = {}
@@ -347,6 +347,10 @@ class FeetechMotorsBus:
         if not self.port_handler.openPort():
             raise OSError(f"Failed to open port '{self.port}'.")
 
+        # Group readers and writers are bound to the previous port and packet handlers
+        self.group_readers = {}
+        self.group_writers = {}
+
         self.is_connected = True
 
     def are_motors_configured(self):
@@ -401,6 +405,9 @@ class FeetechMotorsBus:
 
     def set_calibration(self, calibration: dict[str, list]):
         self.calibration = calibration
+        # Map each motor name to its index in the calibration lists, so that applying or reverting the
+        # calibration at every read and write does not search the list of motor names for each motor.
+        self.calibration_indices = {name: idx for idx, name in enumerate(calibration["motor_names"])}
 
     def apply_calibration_autocorrect(self, values: np.ndarray | list, motor_names: list[str] | None):
         """This function apply the calibration, automatically detects out of range errors for motors values and attempt to correct.
@@ -436,7 +443,7 @@ class FeetechMotorsBus:
         values = values.astype(np.float32)
 
         for i, name in enumerate(motor_names):
-            calib_idx = self.calibration["motor_names"].index(name)
+            calib_idx = self.calibration_indices[name]
             calib_mode = self.calibration["calib_mode"][calib_idx]
 
             if CalibrationMode[calib_mode] == CalibrationMode.DEGREE:
@@ -515,7 +522,7 @@ class FeetechMotorsBus:
         values = values.astype(np.float32)
 
         for i, name in enumerate(motor_names):
-            calib_idx = self.calibration["motor_names"].index(name)
+            calib_idx = self.calibration_indices[name]
             calib_mode = self.calibration["calib_mode"][calib_idx]
 
             if CalibrationMode[calib_mode] == CalibrationMode.DEGREE:
@@ -592,7 +599,7 @@ class FeetechMotorsBus:
             motor_names = self.motor_names
 
         for i, name in enumerate(motor_names):
-            calib_idx = self.calibration["motor_names"].index(name)
+            calib_idx = self.calibration_indices[name]
             calib_mode = self.calibration["calib_mode"][calib_idx]
 
             if CalibrationMode[calib_mode] == CalibrationMode.DEGREE:
@@ -622,7 +629,13 @@ class FeetechMotorsBus:
                 # actual motor range of values which can be arbitrary.
                 values[i] = values[i] / 100 * (end_pos - start_pos) + start_pos
 
-        values = np.round(values).astype(np.int32)
+        # An array is already modified in place above, so it is rounded in place as well
+        # instead of allocating a rounded copy before the int32 one.
+        if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.floating):
+            np.round(values, out=values)
+            values = values.astype(np.int32, copy=False)
+        else:
+            values = np.round(values).astype(np.int32)
         return values
 
     def avoid_rotation_reset(self, values, motor_names, data_name):
@@ -636,11 +649,14 @@ class FeetechMotorsBus:
 
         track = self.track_positions[data_name]
 
+        # `self.motor_names` builds a new list at each access, so it is computed once for all motors
+        all_motor_names = self.motor_names
+
         if motor_names is None:
-            motor_names = self.motor_names
+            motor_names = all_motor_names
 
         for i, name in enumerate(motor_names):
-            idx = self.motor_names.index(name)
+            idx = all_motor_names.index(name)
 
             if track["prev"][idx] is None:
                 track["prev"][idx] = values[i]
@@ -730,11 +746,11 @@ class FeetechMotorsBus:
         addr, bytes = self.model_ctrl_table[model][data_name]
         group_key = get_group_sync_key(data_name, motor_names)
 
-        if data_name not in self.group_readers:
-            # Very Important to flush the buffer!
-            self.port_handler.ser.reset_output_buffer()
-            self.port_handler.ser.reset_input_buffer()
+        # Very Important to flush the buffer!
+        self.port_handler.ser.reset_output_buffer()
+        self.port_handler.ser.reset_input_buffer()
 
+        if group_key not in self.group_readers:
             # create new group reader
             self.group_readers[group_key] = scs.GroupSyncRead(
                 self.port_handler, self.packet_handler, addr, bytes
@@ -771,11 +787,11 @@ class FeetechMotorsBus:
             values = self.apply_calibration_autocorrect(values, motor_names)
 
         # log the number of seconds it took to read the data from the motors
-        delta_ts_name = get_log_name("delta_timestamp_s", "read", data_name, motor_names)
+        delta_ts_name = get_log_name("delta_timestamp_s", "read", group_key)
         self.logs[delta_ts_name] = time.perf_counter() - start_time
 
         # log the utc time at which the data was received
-        ts_utc_name = get_log_name("timestamp_utc", "read", data_name, motor_names)
+        ts_utc_name = get_log_name("timestamp_utc", "read", group_key)
         self.logs[ts_utc_name] = capture_timestamp_utc()
 
         return values
@@ -831,8 +847,6 @@ class FeetechMotorsBus:
         if isinstance(values, (int, float, np.integer)):
             values = [int(values)] * len(motor_names)
 
-        values = np.array(values)
-
         motor_ids = []
         models = []
         for name in motor_names:
@@ -841,15 +855,21 @@ class FeetechMotorsBus:
             models.append(model)
 
         if data_name in CALIBRATION_REQUIRED and self.calibration is not None:
-            values = self.revert_calibration(values, motor_names)
+            # `revert_calibration` modifies its input in place, so it gets its own array
+            values = self.revert_calibration(np.array(values), motor_names)
 
-        values = values.tolist()
+        # Values are sent as python numbers. Lists, such as the ones created for a single value,
+        # are used as is instead of making a round trip through numpy.
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        elif not isinstance(values, list):
+            values = np.array(values).tolist()
 
         assert_same_address(self.model_ctrl_table, models, data_name)
         addr, bytes = self.model_ctrl_table[model][data_name]
         group_key = get_group_sync_key(data_name, motor_names)
 
-        init_group = data_name not in self.group_readers
+        init_group = group_key not in self.group_writers
         if init_group:
             self.group_writers[group_key] = scs.GroupSyncWrite(
                 self.port_handler, self.packet_handler, addr, bytes
@@ -870,12 +890,12 @@ class FeetechMotorsBus:
             )
 
         # log the number of seconds it took to write the data to the motors
-        delta_ts_name = get_log_name("delta_timestamp_s", "write", data_name, motor_names)
+        delta_ts_name = get_log_name("delta_timestamp_s", "write", group_key)
         self.logs[delta_ts_name] = time.perf_counter() - start_time
 
         # TODO(rcadene): should we log the time before sending the write command?
         # log the utc time when the write has been completed
-        ts_utc_name = get_log_name("timestamp_utc", "write", data_name, motor_names)
+        ts_utc_name = get_log_name("timestamp_utc", "write", group_key)
         self.logs[ts_utc_name] = capture_timestamp_utc()
 
     def disconnect(self):
@@ -28,9 +28,8 @@ URL_TEMPLATE = (
     "https://raw.githubusercontent.com/huggingface/lerobot/main/media/{robot}/{arm}_{position}.webp"
 )
 
-# The following positions are provided in nominal degree range ]-180, +180[
-# For more info on these constants, see comments in the code where they get used.
-ZERO_POSITION_DEGREE = 0
+# The following position is provided in nominal degree range ]-180, +180[
+# For more info on this constant, see comments in the code where it gets used.
 ROTATED_POSITION_DEGREE = 90
 
 
@@ -86,15 +85,10 @@ def run_arm_calibration(arm: MotorsBus, robot_type: str, arm_name: str, arm_type
     print("See: " + URL_TEMPLATE.format(robot=robot_type, arm=arm_type, position="zero"))
     input("Press Enter to continue...")
 
-    # We arbitrarily chose our zero target position to be a straight horizontal position with gripper upwards and closed.
-    # It is easy to identify and all motors are in a "quarter turn" position. Once calibration is done, this position will
-    # correspond to every motor angle being 0. If you set all 0 as Goal Position, the arm will move in this position.
-    zero_target_pos = convert_degrees_to_steps(ZERO_POSITION_DEGREE, arm.motor_models)
-
-    # Compute homing offset so that `present_position + homing_offset ~= target_position`.
+    # The zero position is a straight horizontal position with gripper upwards and closed. The present position read
+    # in this pose is compared to the one in the rotated position below to find the drive mode of each motor, and is
+    # saved as `start_pos`.
     zero_pos = arm.read("Present_Position")
-    zero_nearest_pos = compute_nearest_rounded_position(zero_pos, arm.motor_models)
-    homing_offset = zero_target_pos - zero_nearest_pos
 
     # The rotated target position corresponds to a rotation of a quarter turn from the zero position.
     # This allows to identify the rotation direction of each motor.
@@ -114,7 +108,8 @@ def run_arm_calibration(arm: MotorsBus, robot_type: str, arm_name: str, arm_type
     rotated_pos = arm.read("Present_Position")
     drive_mode = (rotated_pos < zero_pos).astype(np.int32)
 
-    # Re-compute homing offset to take into account drive mode
+    # Compute homing offset so that `present_position + homing_offset ~= target_position`,
+    # taking into account drive mode
     rotated_drived_pos = apply_drive_mode(rotated_pos, drive_mode)
     rotated_nearest_pos = compute_nearest_rounded_position(rotated_drived_pos, arm.motor_models)
     homing_offset = rotated_target_pos - rotated_nearest_pos
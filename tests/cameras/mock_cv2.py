@@ -23,6 +23,7 @@ CAP_ANY = -1
 CAP_PROP_FPS = 5
 CAP_PROP_FRAME_WIDTH = 3
 CAP_PROP_FRAME_HEIGHT = 4
+CAP_PROP_BUFFERSIZE = 38
 COLOR_RGB2BGR = 4
 COLOR_BGR2RGB = 4
 
@@ -43,6 +44,15 @@ def cvtColor(color_image, color_conversion):  # noqa: N802
         raise NotImplementedError(color_conversion)
 
 
+def flip(image, flip_code):
+    if flip_code == 0:
+        return np.flip(image, axis=0)
+    elif flip_code > 0:
+        return np.flip(image, axis=1)
+    else:
+        return np.flip(image, axis=(0, 1))
+
+
 def rotate(color_image, rotation):
     if rotation is None:
         return color_image
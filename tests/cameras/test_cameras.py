@@ -34,6 +34,8 @@ pytest -sx 'tests/test_cameras.py::test_camera[intelrealsense-True]'
 ```
 """
 
+import platform
+
 import numpy as np
 import pytest
 
@@ -170,6 +172,19 @@ def test_camera(request, camera_type, mock):
         )
         del camera
 
+    # Test acquiring a rotated bgr image
+    camera = make_camera(**camera_kwargs, color_mode="bgr", rotation=180)
+    camera.connect()
+    rot_bgr_color_image = camera.read()
+    np.testing.assert_allclose(
+        rot_bgr_color_image,
+        np.rot90(color_image, k=2)[:, :, [2, 1, 0]],
+        rtol=1e-5,
+        atol=MAX_PIXEL_DIFFERENCE,
+        err_msg=error_msg,
+    )
+    del camera
+
     # TODO(rcadene): Add a test for a camera that doesnt support fps=60 and raises an OSError
     # TODO(rcadene): Add a test for a camera that supports fps=60
 
@@ -186,6 +201,21 @@ def test_camera(request, camera_type, mock):
     assert c == 3
     del camera
 
+    if camera_type == "opencv":
+        # Test the capture buffer size can be set
+        camera = make_camera(**camera_kwargs, buffer_size=1)
+        camera.connect()
+        assert camera.buffer_size == 1
+        # Only the V4L2 backend used on Linux supports this property, the others ignore it
+        if mock or platform.system() == "Linux":
+            assert camera.camera.get(cv2.CAP_PROP_BUFFERSIZE) == 1
+        assert camera.read().shape == (camera.capture_height, camera.capture_width, 3)
+        del camera
+
+        # Test an empty capture buffer raises an error
+        with pytest.raises(ValueError):
+            make_camera(**camera_kwargs, buffer_size=0)
+
     # Test not supported width and height raise an error
     camera = make_camera(**camera_kwargs, fps=30, width=0, height=0)
     with pytest.raises(OSError):
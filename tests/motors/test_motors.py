@@ -147,6 +147,24 @@ def test_motors_bus(request, motor_type, mock):
     values = motors_bus.read("Torque_Enable")
     assert (values == 1).all()
 
+    # Test the group reader created for a set of motors is reused by the next reads
+    if motor_type == "dynamixel":
+        from lerobot.common.robot_devices.motors.dynamixel import get_group_sync_key
+    elif motor_type == "feetech":
+        from lerobot.common.robot_devices.motors.feetech import get_group_sync_key
+
+    group_key = get_group_sync_key("Torque_Enable", motors_bus.motor_names)
+    group_reader = motors_bus.group_readers[group_key]
+    motors_bus.read("Torque_Enable")
+    assert motors_bus.group_readers[group_key] is group_reader
+
+    # Test the group writer created for a set of motors is reused by the next writes
+    group_writer = motors_bus.group_writers[group_key]
+    motors_bus.write("Torque_Enable", 0)
+    assert motors_bus.group_writers[group_key] is group_writer
+    assert (motors_bus.read("Torque_Enable") == 0).all()
+    motors_bus.write("Torque_Enable", 1)
+
     # Test ordering the motors to move slightly (+1 value among 4096) and this move
     # can be executed and seen by the motor position sensor
     values = motors_bus.read("Present_Position")
@@ -155,3 +173,28 @@ def test_motors_bus(request, motor_type, mock):
     time.sleep(1)
     new_values = motors_bus.read("Present_Position")
     assert (new_values == values).all()
+
+
+@pytest.mark.parametrize("motor_type, mock", TEST_MOTOR_TYPES)
+@require_motor
+def test_revert_calibration(request, motor_type, mock):
+    motors_bus = make_motors_bus(motor_type, mock=mock)
+    num_motors = len(motors_bus.motors)
+    motors_bus.set_calibration(
+        {
+            "homing_offset": [0] * num_motors,
+            "drive_mode": [0] * num_motors,
+            "start_pos": [0] * num_motors,
+            "end_pos": [0] * num_motors,
+            "calib_mode": ["DEGREE"] * num_motors,
+            "motor_names": motors_bus.motor_names,
+        }
+    )
+    degrees = [10.0 * i for i in range(num_motors)]
+
+    # Test reverting the calibration of an array and of a list gives the same int32 motor values
+    values = motors_bus.revert_calibration(np.array(degrees, dtype=np.float32), None)
+    assert values.dtype == np.int32
+    list_values = motors_bus.revert_calibration(degrees, None)
+    assert list_values.dtype == np.int32
+    np.testing.assert_array_equal(values, list_values)